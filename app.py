@@ -1,8 +1,10 @@
-import time
+import hmac
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
 import streamlit as st
 
 
@@ -31,7 +33,8 @@ if not st.session_state.authed:
     pw = st.text_input("Password", type="password")
 
     if st.button("Enter"):
-        if pw == st.secrets["APP_PASSWORD"]:
+        # Constant-time compare; bytes so non-ASCII input doesn't raise
+        if hmac.compare_digest(pw.encode(), st.secrets["APP_PASSWORD"].encode()):
             st.session_state.authed = True
             st.rerun()
         else:
@@ -57,6 +60,12 @@ BUCKET_ORDER = [
 
 BUCKET_ORDER_DISPLAY = [b.replace("z100+", "100+") for b in BUCKET_ORDER]
 
+# Column position of each bucket in the per-artist count table
+_BUCKET_POS = {b: i for i, b in enumerate(BUCKET_ORDER)}
+
+# Delay between animation steps (played client-side by Plotly.js)
+ANIMATION_FRAME_MS = 70
+
 
 # =========================================================
 # Files (expected to be in repo root)
@@ -64,6 +73,9 @@ BUCKET_ORDER_DISPLAY = [b.replace("z100+", "100+") for b in BUCKET_ORDER]
 COMPLETE_CSV = Path("time_to_complete.csv")
 START_CSV = Path("time_to_start.csv")
 
+# Served at app/static/ (server.enableStaticServing in .streamlit/config.toml)
+STATIC_DIR = Path(__file__).parent / "static"
+
 
 # =========================================================
 # Load data (cached)
@@ -76,80 +88,146 @@ def load_dataset(csv_path: str) -> pd.DataFrame:
             f"Missing file: {p}. Put it in the same folder as app.py (repo root)."
         )
 
-    df = pd.read_csv(p)
-
     expected = {"artist", "bucket", "jobs_count"}
+
+    # Typed single-pass parse (nullable Int32 so blank counts can become 0 below)
+    try:
+        df = pd.read_csv(
+            p,
+            usecols=lambda c: c in expected,
+            dtype={"artist": "string[pyarrow]", "bucket": "string[pyarrow]", "jobs_count": "Int32"},
+            engine="c",
+        )
+    except ValueError as e:
+        raise ValueError(f"Could not parse {p}: {e}") from e
+
     if not expected.issubset(set(df.columns)):
         raise ValueError(
             f"{p} must have columns: artist, bucket, jobs_count. Found: {list(df.columns)}"
         )
 
-    df = df.copy()
-    df["jobs_count"] = pd.to_numeric(df["jobs_count"], errors="coerce").fillna(0).astype(int)
-
-    # Enforce bucket ordering
-    df["bucket"] = pd.Categorical(df["bucket"], categories=BUCKET_ORDER, ordered=True)
+    df["jobs_count"] = df["jobs_count"].fillna(0).astype("int32")
 
     return df
 
 
-def ensure_all_buckets(artist_data: pd.DataFrame) -> pd.DataFrame:
-    """Ensure every bucket exists for the artist (missing buckets become 0)."""
-    full = pd.DataFrame({"bucket": BUCKET_ORDER})
-    full["bucket"] = pd.Categorical(full["bucket"], categories=BUCKET_ORDER, ordered=True)
-
-    out = (
-        full.merge(artist_data[["bucket", "jobs_count"]], on="bucket", how="left")
-        .fillna({"jobs_count": 0})
+@st.cache_data(show_spinner=False)
+def pivot_by_artist(dataset_label: str) -> pd.DataFrame:
+    """Artist x bucket table of job counts (every bucket present, missing ones are 0)."""
+    df = DATASETS[dataset_label]
+    artist_idx, artists = pd.factorize(df["artist"], sort=True)
+    bucket_idx = df["bucket"].map(_BUCKET_POS).fillna(-1).to_numpy(dtype=np.intp)
+
+    # Scatter-add each row into its (artist, bucket) cell; unknown buckets are dropped
+    keep = (artist_idx >= 0) & (bucket_idx >= 0)
+    counts = np.zeros((len(artists), len(BUCKET_ORDER)), dtype=np.int32)
+    np.add.at(
+        counts,
+        (artist_idx[keep], bucket_idx[keep]),
+        df["jobs_count"].to_numpy()[keep],
     )
-    out["jobs_count"] = out["jobs_count"].astype(int)
-    return out
 
+    return pd.DataFrame(counts, index=artists, columns=BUCKET_ORDER)
 
-def add_percent_share(df: pd.DataFrame) -> pd.DataFrame:
-    """Add pct_share and label columns based on total jobs for selected artist."""
-    out = df.copy()
-    total = int(out["jobs_count"].sum())
-    if total > 0:
-        out["pct_share"] = out["jobs_count"] / total * 100.0
-    else:
-        out["pct_share"] = 0.0
 
-    # Nice label for chart: "58 (12.3%)"
-    out["label"] = out.apply(lambda r: f"{int(r['jobs_count'])} ({r['pct_share']:.1f}%)", axis=1)
+@st.cache_data(show_spinner=False)
+def get_artist_list(*dataset_labels: str) -> list:
+    """Sorted union of artist names across the given datasets."""
+    return sorted(set().union(*(DATASETS[label]["artist"].unique() for label in dataset_labels)))
 
-    # Display-friendly bucket label (turn z100+ into 100+)
-    out["bucket_label"] = out["bucket"].astype(str).replace({"z100+": "100+"})
 
-    return out
+def artist_bucket_counts(dataset_label: str, artist: str) -> pd.Series:
+    """Job counts per bucket for one artist (all zeros if absent from the dataset)."""
+    pivoted = pivot_by_artist(dataset_label)
+    if artist in pivoted.index:
+        return pivoted.loc[artist]
+    return pd.Series(0, index=BUCKET_ORDER)
 
 
-def build_chart(plot_df: pd.DataFrame, artist: str, dataset_label: str):
-    fig = px.bar(
-        plot_df,
-        x="bucket_label",
-        y="jobs_count",
-        text="label",
-        title=f"{dataset_label} distribution — {artist}",
-        category_orders={"bucket_label": BUCKET_ORDER_DISPLAY},
+def add_percent_share(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a new frame with pct_share and label columns (df is left untouched).
+
+    Expects bucket, bucket_label and jobs_count columns.
+    """
+    jobs = df["jobs_count"]
+    total = int(jobs.sum())
+    pct_share = jobs / total * 100.0 if total > 0 else pd.Series(0.0, index=df.index)
+
+    return pd.DataFrame(
+        {
+            "bucket": df["bucket"],
+            "jobs_count": jobs,
+            "pct_share": pct_share,
+            # Nice label for chart: "58 (12.3%)"
+            "label": jobs.astype(int).astype(str) + " (" + pct_share.round(1).astype(str) + "%)",
+            "bucket_label": df["bucket_label"],
+        }
     )
 
-    # Force categorical axis so Plotly doesn't treat labels like dates/times
-    fig.update_xaxes(type="category")
 
-    # Make tooltips show both count and share cleanly
-    fig.update_traces(
-        hovertemplate=(
-            "<b>Bucket:</b> %{x}<br>"
-            "<b>Jobs:</b> %{y}<br>"
-            "<b>Share:</b> %{customdata[0]:.1f}%<extra></extra>"
-        ),
-        customdata=plot_df[["pct_share"]].to_numpy(),
-        textposition="outside",
-        cliponaxis=False,
+@st.cache_data(show_spinner=False)
+def prepare_artist_frame(dataset_label: str, artist: str) -> pd.DataFrame:
+    """Per-bucket counts + % share for one artist in one dataset (cached per pair)."""
+    counts = artist_bucket_counts(dataset_label, artist)
+    # Counts are always in BUCKET_ORDER, so the display labels are precomputed
+    artist_df = pd.DataFrame(
+        {
+            "bucket": BUCKET_ORDER,
+            "bucket_label": BUCKET_ORDER_DISPLAY,
+            "jobs_count": counts.to_numpy(),
+        }
+    )
+    return add_percent_share(artist_df)
+
+
+def build_chart(plot_df: pd.DataFrame, artist: str, dataset_label: str):
+    x = plot_df["bucket_label"].tolist()
+    ys = plot_df["jobs_count"].tolist()
+    steps = len(x)
+
+    # The figure (full x-axis, layout, trace styling) is built once. Animation
+    # frames only carry the y/text deltas: row i of the lower-triangular mask
+    # reveals the first i + 1 bars, the rest are blank. The figure starts on the
+    # first step; render_chart autoplays the rest.
+    reveal = np.tri(steps, dtype=bool)
+    prefix_ys = np.where(reveal, plot_df["jobs_count"].to_numpy(), np.nan)
+    prefix_texts = np.where(reveal, plot_df["label"].to_numpy(), "")
+    frames = [
+        go.Frame(name=str(i + 1), data=[go.Bar(y=y_step, text=text_step)])
+        for i, (y_step, text_step) in enumerate(zip(prefix_ys, prefix_texts))
+    ]
+
+    fig = go.Figure(
+        data=[
+            go.Bar(
+                x=x,
+                y=prefix_ys[0],
+                text=prefix_texts[0],
+                customdata=plot_df["pct_share"].to_numpy(copy=False).reshape(-1, 1),
+                # Make tooltips show both count and share cleanly
+                hovertemplate=(
+                    "<b>Bucket:</b> %{x}<br>"
+                    "<b>Jobs:</b> %{y}<br>"
+                    "<b>Share:</b> %{customdata[0]:.1f}%<extra></extra>"
+                ),
+                textposition="outside",
+                cliponaxis=False,
+            )
+        ],
+        frames=frames,
     )
 
+    # Force categorical axis so Plotly doesn't treat labels like dates/times.
+    # The y range is pinned so the axis doesn't jump between animation steps.
+    fig.update_xaxes(
+        type="category",
+        categoryorder="array",
+        categoryarray=BUCKET_ORDER_DISPLAY,
+    )
+    fig.update_yaxes(range=[0, max(max(ys, default=0), 1) * 1.15])
+
     fig.update_layout(
+        title=f"{dataset_label} distribution — {artist}",
         xaxis_title="Hours (bucket)",
         yaxis_title="Jobs count",
         height=520,
@@ -160,6 +238,48 @@ def build_chart(plot_df: pd.DataFrame, artist: str, dataset_label: str):
     return fig
 
 
+@st.cache_resource(show_spinner=False)
+def publish_plotly_js() -> str | bool:
+    """Serve the plotly.js bundled with the plotly package from STATIC_DIR.
+
+    Written once per process, so the browser fetches (and caches) the library from
+    this app rather than a CDN. Falls back to inlining it if the folder is read-only.
+    """
+    target = STATIC_DIR / "plotly.min.js"
+    js = get_plotlyjs()
+    try:
+        if not target.exists() or target.read_text(encoding="utf-8") != js:
+            STATIC_DIR.mkdir(exist_ok=True)
+            target.write_text(js, encoding="utf-8")
+    except OSError:
+        return True
+    # Relative URL, so it resolves under the app's own base path
+    return "app/static/plotly.min.js"
+
+
+def render_chart(fig: go.Figure) -> None:
+    """Embed fig so its frames autoplay on load (st.plotly_chart never starts them)."""
+    # Follow the app's light/dark base; Streamlit's own Plotly theme is only
+    # applied inside st.plotly_chart.
+    fig.update_layout(
+        template="plotly_dark" if st.context.theme.type == "dark" else "plotly_white",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+    )
+    st.iframe(
+        fig.to_html(
+            include_plotlyjs=publish_plotly_js(),
+            config={"responsive": True},
+            default_height=f"{fig.layout.height}px",
+            auto_play=True,
+            animation_opts={
+                "frame": {"duration": ANIMATION_FRAME_MS, "redraw": False},
+                "transition": {"duration": ANIMATION_FRAME_MS, "easing": "linear"},
+            },
+        ),
+    )
+
+
 # =========================================================
 # Load both datasets
 # =========================================================
@@ -177,80 +297,54 @@ DATASETS = {
 
 
 # =========================================================
-# Controls (dataset switch + artist select)
+# Artist view (controls, metrics, chart, table)
 # =========================================================
-all_artists = sorted(
-    set(df_complete["artist"].unique().tolist()) | set(df_start["artist"].unique().tolist())
-)
-
-left, right = st.columns([2, 3])
-
-with left:
-    selected_dataset_name = st.radio(
-        "Dataset",
-        options=list(DATASETS.keys()),
-        horizontal=True,
-    )
-
-with right:
-    selected_artist = st.selectbox("Artist", all_artists)
-
-current_df = DATASETS[selected_dataset_name]
-
-
-# =========================================================
-# Filter & normalize for selected artist
-# =========================================================
-artist_raw = current_df[current_df["artist"] == selected_artist].copy()
-
-if artist_raw.empty:
-    # Artist not present in this dataset: show zeros
-    artist_df = pd.DataFrame({"bucket": BUCKET_ORDER, "jobs_count": [0] * len(BUCKET_ORDER)})
-    artist_df["bucket"] = pd.Categorical(artist_df["bucket"], categories=BUCKET_ORDER, ordered=True)
-else:
-    artist_df = ensure_all_buckets(artist_raw)
-
-artist_df = add_percent_share(artist_df)
-
-
-# =========================================================
-# Metrics
-# =========================================================
-total_jobs = int(artist_df["jobs_count"].sum())
-over_100 = int(artist_df.loc[artist_df["bucket"] == "z100+", "jobs_count"].sum())
-
-m1, m2, m3 = st.columns(3)
-m1.metric("Total jobs (selected dataset)", f"{total_jobs}")
-m2.metric("100+ hour jobs", f"{over_100}")
-m3.metric("100+ share", f"{(over_100 / total_jobs * 100):.1f}%" if total_jobs else "—")
-
+# Runs as a fragment: changing the dataset or artist reruns only this block,
+# not the password wall and dataset loading above it.
+@st.fragment
+def render_artist_view():
+    # Controls (dataset switch + artist select)
+    all_artists = get_artist_list(*DATASETS)
+
+    left, right = st.columns([2, 3])
+
+    with left:
+        selected_dataset_name = st.radio(
+            "Dataset",
+            options=list(DATASETS.keys()),
+            horizontal=True,
+        )
 
-# =========================================================
-# Always-on animation (fixed speed, no UI controls)
-# =========================================================
-placeholder = st.empty()
-ANIMATION_SLEEP_SECONDS = 0.07
-
-for i in range(1, len(artist_df) + 1):
-    partial = artist_df.iloc[:i].copy()
-    placeholder.plotly_chart(
-        build_chart(partial, selected_artist, selected_dataset_name),
-        use_container_width=True,
-    )
-    time.sleep(ANIMATION_SLEEP_SECONDS)
+    with right:
+        selected_artist = st.selectbox("Artist", all_artists)
+
+    # Per-artist bucket data (cached per dataset + artist)
+    artist_df = prepare_artist_frame(selected_dataset_name, selected_artist)
+
+    # Metrics (read from the cached per-artist frame)
+    total_jobs = int(artist_df["jobs_count"].sum())
+    over_100 = int(artist_df.loc[artist_df["bucket"] == "z100+", "jobs_count"].sum())
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Total jobs (selected dataset)", f"{total_jobs}")
+    m2.metric("100+ hour jobs", f"{over_100}")
+    m3.metric("100+ share", f"{(over_100 / total_jobs * 100):.1f}%" if total_jobs else "—")
+
+    # Always-on animation (fixed speed, no UI controls)
+    render_chart(build_chart(artist_df, selected_artist, selected_dataset_name))
+
+    # Data table (counts + % share)
+    with st.expander("Show underlying data"):
+        table_df = artist_df[["bucket_label", "jobs_count", "pct_share"]]
+        table_df = table_df.rename(
+            columns={
+                "bucket_label": "bucket",
+                "jobs_count": "jobs_count",
+                "pct_share": "pct_share_percent",
+            }
+        )
+        table_df["pct_share_percent"] = table_df["pct_share_percent"].map(lambda x: round(float(x), 2))
+        st.table(table_df)
 
 
-# =========================================================
-# Data table (counts + % share)
-# =========================================================
-with st.expander("Show underlying data"):
-    table_df = artist_df[["bucket_label", "jobs_count", "pct_share"]].copy()
-    table_df = table_df.rename(
-        columns={
-            "bucket_label": "bucket",
-            "jobs_count": "jobs_count",
-            "pct_share": "pct_share_percent",
-        }
-    )
-    table_df["pct_share_percent"] = table_df["pct_share_percent"].map(lambda x: round(float(x), 2))
-    st.dataframe(table_df, use_container_width=True)
+render_artist_view()